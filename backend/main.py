@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Carbon-Trace: Industrial Emission Auditor (SDG 13)."""
 
+import heapq
 from pathlib import Path
 from src.runner import run_audit, write_summary_csv, plot_emissions
 from src.data_gen import generate_monthly_data
+from src.closures import format_alert
 
 def main():
     project_root = Path(__file__).parent
@@ -27,8 +29,15 @@ def main():
     
     # Print summary stats
     total_factories = len(factories)
-    total_emissions_all = sum(f.total_emissions for f in factories.values())
-    alerts = sum(f.alerts_count for f in factories.values())
+    # one pass collects the totals and the violators shown at the end
+    total_emissions_all = 0.0
+    alerts = 0
+    violators = []
+    for f in factories.values():
+        total_emissions_all += f.total_emissions
+        alerts += f.alerts_count
+        if f.alerts_count > 0:
+            violators.append((f.factory_id, f.total_emissions, f.alerts_count, f.carbon_cap_kg))
     
     print(f"\n📈 Audit Complete:")
     print(f"   {total_factories} factories audited")
@@ -47,12 +56,12 @@ def main():
     print(f"   📊 {chart_file}")
     
     # Show top violators
-    violators = [(f.factory_id, f.total_emissions, f.alerts_count) 
-                for f in factories.values() if f.alerts_count > 0]
-    if violators:
+    top_violators = heapq.nlargest(3, violators, key=lambda x: x[1])
+    if top_violators:
         print("\n🚨 Top violators:")
-        for fid, total, alerts in sorted(violators, key=lambda x: x[1], reverse=True)[:3]:
+        for fid, total, alerts, cap in top_violators:
             print(f"   {fid}: {total:,.0f}kg ({alerts} alerts)")
+            print(f"      {format_alert(total, cap)}")
 
 if __name__ == "__main__":
     main()
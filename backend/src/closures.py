@@ -1,29 +1,59 @@
 """Carbon-Trace: Secure emission auditor closures."""
 
-def make_emission_auditor(sector: str, carbon_cap_kg: float) -> callable:
+# Sector-specific emission factors (kg CO2): (per ton produced, per MWh used)
+EMISSION_FACTORS: dict[str, tuple[float, float]] = {
+    "Steel": (2.5, 0.6),
+    "Textile": (1.2, 0.4),
+    "Electronics": (1.8, 0.5),
+}
+
+# Energy source multipliers; unknown or missing sources use the 1.0 baseline
+ENERGY_SOURCE_MULTIPLIERS: dict[str, float] = {
+    "coal": 1.2,
+    "grid": 1.0,
+    "renewable": 0.7,
+}
+
+
+def month_kernel(production_tons, energy_mwh, per_ton, per_mwh, source_multiplier):
+    """Monthly emissions (kg CO2) from production and energy inputs.
+
+    Plain arithmetic that works on floats and NumPy arrays alike, so the
+    closure and the vectorized audit share one formula.
+    """
+    return (production_tons * per_ton + energy_mwh * per_mwh) * source_multiplier
+
+
+def format_alert(total_emissions_kg: float, carbon_cap_kg: float) -> str:
+    """Human-readable message for a factory over its carbon cap."""
+    return (
+        f"🚨 Carbon cap exceeded! "
+        f"Total: {total_emissions_kg:.0f} kg CO₂ "
+        f"(cap: {carbon_cap_kg:.0f} kg)"
+    )
+
+
+def make_emission_auditor(sector: str,
+                          carbon_cap_kg: float,
+                          opening_total_kg: float = 0.0) -> callable:
     """
     Factory function that returns a closure for one factory's emissions.
     
     Private state:
-    - total_emissions: accumulates across monthly calls
+    - total_emissions: accumulates across monthly calls, starting from
+      ``opening_total_kg`` (used to resume after a batch audit)
     - emission factors: sector-specific, hidden
     
     Returns auditor callable with clean interface.
     """
-    # PRIVATE: Sector-specific emission factors (kg CO2)
-    emission_factors = {
-        "Steel": {"production_per_ton": 2.5, "energy_per_mwh": 0.6},
-        "Textile": {"production_per_ton": 1.2, "energy_per_mwh": 0.4},
-        "Electronics": {"production_per_ton": 1.8, "energy_per_mwh": 0.5},
-    }
-    
-    if sector not in emission_factors:
-        raise ValueError(f"Unknown sector: {sector}")
-    
-    factors = emission_factors[sector]
+    # fixed for this factory: bind once instead of looking up every month
+    try:
+        fp, fe = EMISSION_FACTORS[sector]
+    except KeyError:
+        raise ValueError(f"Unknown sector: {sector}") from None
     
     # PRIVATE STATE: persists across calls
-    total_emissions = 0.0
+    total_emissions = float(opening_total_kg)
     
     def auditor(monthly_production_tons: float,
                 energy_used_mwh: float,
@@ -31,38 +61,26 @@ def make_emission_auditor(sector: str, carbon_cap_kg: float) -> callable:
                 raw_material_weight_tons: float | None = None) -> dict:
         nonlocal total_emissions
         
-        # Core calculation
-        emissions_production = monthly_production_tons * factors["production_per_ton"]
-        emissions_energy = energy_used_mwh * factors["energy_per_mwh"]
-        monthly_emissions = emissions_production + emissions_energy
-        
         # Energy source multiplier (optional enhancement)
-        if energy_source_type == "coal":
-            monthly_emissions *= 1.2
-        elif energy_source_type == "renewable":
-            monthly_emissions *= 0.7
-        elif energy_source_type == "grid":
-            pass  # baseline
+        monthly_emissions = month_kernel(
+            monthly_production_tons,
+            energy_used_mwh,
+            fp,
+            fe,
+            ENERGY_SOURCE_MULTIPLIERS.get(energy_source_type, 1.0),
+        )
         
         # Accumulate
         total_emissions += monthly_emissions
         
-        # Carbon cap check
-        status = "OK"
-        alert = None
-        if total_emissions > carbon_cap_kg:
-            status = "ALERT"
-            alert = (
-                f"🚨 Carbon cap exceeded! "
-                f"Total: {total_emissions:.0f} kg CO₂ "
-                f"(cap: {carbon_cap_kg:.0f} kg)"
-            )
+        # Carbon cap check (callers format a message with format_alert)
+        exceeded_by = total_emissions - carbon_cap_kg
         
         return {
-            "monthly_emissions_kg": round(monthly_emissions, 2),
-            "total_emissions_kg": round(total_emissions, 2),
-            "status": status,
-            "alert": alert,
+            "monthly_emissions_kg": monthly_emissions,
+            "total_emissions_kg": total_emissions,
+            "status": "ALERT" if exceeded_by > 0 else "OK",
+            "cap_exceeded_by": exceeded_by if exceeded_by > 0 else 0.0,
         }
     
     return auditor
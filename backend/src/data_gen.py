@@ -8,8 +8,6 @@ scientifically grounded instead of purely random.
 
 from __future__ import annotations
 
-import csv
-import random
 from pathlib import Path
 from typing import List, Dict
 
@@ -40,11 +38,6 @@ def _anchored_to_owid(owid_csv_path: Path) -> pd.DataFrame:
         1.1, 1.3, size=len(df)
     )
 
-    # Round for neatness
-    df["monthly_production_tons"] = df["monthly_production_tons"].round(1)
-    df["energy_used_mwh"] = df["energy_used_mwh"].round(1)
-    df["raw_material_weight_tons"] = df["raw_material_weight_tons"].round(1)
-
     return df[
         [
             "factory_id",
@@ -58,63 +51,56 @@ def _anchored_to_owid(owid_csv_path: Path) -> pd.DataFrame:
     ]
 
 
-def _pure_synthetic(seed: int | None = None) -> List[Dict[str, float]]:
+ENERGY_SOURCES = np.array(["coal", "grid", "renewable"])
+
+# Pure-synthetic base ranges per sector: (production tons, energy MWh)
+SYNTHETIC_BASE_RANGES: Dict[str, tuple] = {
+    "Steel": ((1000, 1500), (4500, 6000)),
+    "Textile": ((300, 500), (700, 1000)),
+    "Electronics": ((200, 400), (1000, 1500)),
+}
+SYNTHETIC_SECTOR_NAMES = np.array(list(SYNTHETIC_BASE_RANGES))
+SYNTHETIC_ID_PREFIXES = ["STEEL", "TEX", "ELEC"]
+
+
+def _pure_synthetic(seed: int | None = None) -> pd.DataFrame:
     """Original random generator kept as a fallback."""
-    factories: List[str] = []
-
-    # Steel factories (20)
-    for i in range(1, 21):
-        factories.append(f"FAC_STEEL_{i:02d}")
-
-    # Textile (15)
-    for i in range(1, 16):
-        factories.append(f"FAC_TEX_{i:02d}")
-
-    # Electronics (15)
-    for i in range(1, 16):
-        factories.append(f"FAC_ELEC_{i:02d}")
-
-    if seed is not None:
-        random.seed(seed)
-
-    all_rows: List[Dict[str, float]] = []
-
-    for factory_id in factories:
-        if "STEEL" in factory_id:
-            sector = "Steel"
-            base_prod = random.uniform(1000, 1500)  # tons
-            base_energy = random.uniform(4500, 6000)  # MWh
-        elif "TEX" in factory_id:
-            sector = "Textile"
-            base_prod = random.uniform(300, 500)
-            base_energy = random.uniform(700, 1000)
-        else:  # Electronics
-            sector = "Electronics"
-            base_prod = random.uniform(200, 400)
-            base_energy = random.uniform(1000, 1500)
-
-        for month in range(1, 13):
-            prod = base_prod * random.uniform(0.85, 1.15)
-            energy = base_energy * random.uniform(0.85, 1.15)
-
-            energy_sources = random.choices(
-                ["coal", "grid", "renewable"], weights=[0.4, 0.5, 0.1], k=1
-            )[0]
-
-            row = {
-                "factory_id": factory_id,
-                "sector": sector,
-                "month": month,
-                "monthly_production_tons": round(prod, 1),
-                "energy_used_mwh": round(energy, 1),
-                "energy_source_type": energy_sources,
-                "raw_material_weight_tons": round(
-                    prod * random.uniform(1.1, 1.3), 1
-                ),
-            }
-            all_rows.append(row)
-
-    return all_rows
+    # factories come in contiguous sector blocks, so the sector is known
+    # from the position alone: 20 Steel, 15 Textile, 15 Electronics
+    block_sizes = [20, 15, 15]
+    sector_codes = np.repeat(np.arange(len(SYNTHETIC_SECTOR_NAMES)), block_sizes)
+    factories: List[str] = [
+        f"FAC_{prefix}_{i:02d}"
+        for prefix, size in zip(SYNTHETIC_ID_PREFIXES, block_sizes)
+        for i in range(1, size + 1)
+    ]
+
+    ranges = np.array([SYNTHETIC_BASE_RANGES[s] for s in SYNTHETIC_SECTOR_NAMES])
+    ranges = ranges[sector_codes]  # (n, 2, 2)
+
+    # every random draw is taken in bulk from one generator, as
+    # (factory, month) matrices where a value varies monthly
+    rng = np.random.default_rng(seed)
+    n_months = 12
+    shape = (len(factories), n_months)
+
+    base_prod = rng.uniform(ranges[:, 0, 0], ranges[:, 0, 1])
+    base_energy = rng.uniform(ranges[:, 1, 0], ranges[:, 1, 1])
+
+    prod = base_prod[:, None] * rng.uniform(0.85, 1.15, shape)
+    energy = base_energy[:, None] * rng.uniform(0.85, 1.15, shape)
+    raw_material = prod * rng.uniform(1.1, 1.3, shape)
+    source_codes = rng.choice(len(ENERGY_SOURCES), size=shape, p=[0.4, 0.5, 0.1])
+
+    return pd.DataFrame({
+        "factory_id": np.repeat(factories, n_months),
+        "sector": SYNTHETIC_SECTOR_NAMES[np.repeat(sector_codes, n_months)],
+        "month": np.tile(np.arange(1, n_months + 1), len(factories)),
+        "monthly_production_tons": prod.ravel(),
+        "energy_used_mwh": energy.ravel(),
+        "energy_source_type": ENERGY_SOURCES[source_codes.ravel()],
+        "raw_material_weight_tons": raw_material.ravel(),
+    })
 
 
 def generate_monthly_data(
@@ -139,18 +125,6 @@ def generate_monthly_data(
     original pure-synthetic generator so the rest of the closure-based
     auditing pipeline still works.
     """
-    owid_df: pd.DataFrame | None = None
-    if owid_csv_path is not None:
-        owid_path = Path(owid_csv_path)
-        if owid_path.exists():
-            owid_df = _anchored_to_owid(owid_path)
-
-    if owid_df is not None:
-        df = owid_df
-        rows = df.to_dict(orient="records")
-    else:
-        rows = _pure_synthetic(seed=seed)
-
     fieldnames = [
         "factory_id",
         "sector",
@@ -161,13 +135,18 @@ def generate_monthly_data(
         "raw_material_weight_tons",
     ]
 
-    with open(output_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    df: pd.DataFrame | None = None
+    if owid_csv_path is not None:
+        owid_path = Path(owid_csv_path)
+        if owid_path.exists():
+            df = _anchored_to_owid(owid_path)
+    if df is None:
+        df = _pure_synthetic(seed=seed)
 
-    print(f"✅ Generated {len(rows)} rows → {output_path}")
+    # values are rounded once, for neatness, as they are written
+    df[fieldnames].to_csv(output_path, index=False, float_format="%.1f")
 
+    print(f"✅ Generated {len(df)} rows → {output_path}")
 
 if __name__ == "__main__":
     project_root = Path(__file__).resolve().parents[1]
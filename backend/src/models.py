@@ -1,17 +1,38 @@
 """Factory models wrapping auditor closures."""
 
 from typing import List, Dict, Any
+
+import numpy as np
+
 from .closures import make_emission_auditor
 
+# A year of monthly records; buffers grow if a factory reports more.
+_INITIAL_MONTHS = 12
+
 class Factory:
+    # fixed attribute layout: no per-instance __dict__
+    __slots__ = (
+        "factory_id", "sector", "carbon_cap_kg", "_auditor",
+        "_months", "_monthly", "_cumulative", "_over_cap",
+        "_n", "_in_month_order",
+    )
+
     def __init__(self, factory_id: str, sector: str, carbon_cap_kg: float):
         self.factory_id = factory_id
         self.sector = sector
+        self.carbon_cap_kg = carbon_cap_kg
         # PRIVATE: Each factory gets its own closure
         self._auditor = make_emission_auditor(sector, carbon_cap_kg)
-        self.history: List[Dict[str, Any]] = []
-    
-    def record_month(self, 
+        # Monthly results as parallel arrays; only the first _n are valid
+        self._months = np.empty(_INITIAL_MONTHS, dtype=np.int8)
+        self._monthly = np.empty(_INITIAL_MONTHS)
+        self._cumulative = np.empty(_INITIAL_MONTHS)
+        self._over_cap = np.empty(_INITIAL_MONTHS, dtype=bool)
+        self._n = 0
+        # records normally arrive month by month; remember if they don't
+        self._in_month_order = True
+
+    def record_month(self,
                      month: int,
                      monthly_production_tons: float,
                      energy_used_mwh: float,
@@ -24,23 +45,119 @@ class Factory:
             energy_source_type,
             raw_material_weight_tons,
         )
-        
+
         # Enrich with metadata
         result.update({
             "factory_id": self.factory_id,
             "sector": self.sector,
             "month": month,
         })
-        
-        self.history.append(result)
+
+        self._store(
+            [month],
+            [result["monthly_emissions_kg"]],
+            [result["total_emissions_kg"]],
+            [result["status"] == "ALERT"],
+        )
         return result
-    
+
+    def load_history(self,
+                     months: np.ndarray,
+                     monthly_emissions_kg: np.ndarray,
+                     total_emissions_kg: np.ndarray) -> None:
+        """Adopt pre-computed monthly results (e.g. from a batch audit).
+
+        The closure is re-seeded with the resulting total so later
+        ``record_month`` calls keep accumulating from there.
+        """
+        total_emissions_kg = np.asarray(total_emissions_kg, dtype=float)
+        self._store(
+            months,
+            monthly_emissions_kg,
+            total_emissions_kg,
+            total_emissions_kg > self.carbon_cap_kg,
+        )
+        self._auditor = make_emission_auditor(
+            self.sector, self.carbon_cap_kg, self.total_emissions
+        )
+
+    def _store(self, months, monthly, cumulative, over_cap) -> None:
+        """Append results to the month arrays, growing them if needed."""
+        start, end = self._n, self._n + len(months)
+        if end > len(self._months):
+            size = max(end, 2 * len(self._months))
+            for name in ("_months", "_monthly", "_cumulative", "_over_cap"):
+                old = getattr(self, name)
+                new = np.empty(size, dtype=old.dtype)
+                new[:start] = old[:start]
+                setattr(self, name, new)
+
+        self._months[start:end] = months
+        self._monthly[start:end] = monthly
+        self._cumulative[start:end] = cumulative
+        self._over_cap[start:end] = over_cap
+
+        # include the previous month so order is checked across calls
+        if self._in_month_order:
+            self._in_month_order = bool(
+                np.all(np.diff(self._months[max(start - 1, 0):end]) >= 0)
+            )
+        self._n = end
+
+    @property
+    def months(self) -> np.ndarray:
+        """Month of each record, in insertion order."""
+        return self._months[:self._n]
+
+    @property
+    def monthly_emissions(self) -> np.ndarray:
+        """Emissions of each recorded month (kg CO₂)."""
+        return self._monthly[:self._n]
+
+    @property
+    def cumulative_emissions(self) -> np.ndarray:
+        """Running total after each recorded month (kg CO₂)."""
+        return self._cumulative[:self._n]
+
+    @property
+    def month_order(self) -> slice | np.ndarray:
+        """Index that puts the month arrays in month order."""
+        if self._in_month_order:
+            return slice(None)
+        return np.argsort(self.months, kind="stable")
+
+    @property
+    def history(self) -> List[Dict[str, Any]]:
+        """Monthly records as dicts, built on demand from the arrays."""
+        return [
+            {
+                "monthly_emissions_kg": float(monthly),
+                "total_emissions_kg": float(total),
+                "status": "ALERT" if over else "OK",
+                "cap_exceeded_by": float(total - self.carbon_cap_kg) if over else 0.0,
+                "factory_id": self.factory_id,
+                "sector": self.sector,
+                "month": int(month),
+            }
+            for month, monthly, total, over in zip(
+                self.months,
+                self.monthly_emissions,
+                self.cumulative_emissions,
+                self._over_cap[:self._n],
+            )
+        ]
+
     @property
     def total_emissions(self) -> float:
         """Read-only total emissions."""
-        return self.history[-1]["total_emissions_kg"] if self.history else 0.0
-    
+        return float(self._cumulative[self._n - 1]) if self._n else 0.0
+
+    @property
+    def max_monthly_emissions(self) -> float:
+        """Largest single-month emissions recorded so far."""
+        return float(self.monthly_emissions.max()) if self._n else 0.0
+
     @property
     def alerts_count(self) -> int:
         """Count of months over cap."""
-        return sum(1 for r in self.history if r["status"] == "ALERT")
+        return int(self._over_cap[:self._n].sum())
@@ -1,11 +1,16 @@
 """Main Carbon-Trace auditing engine."""
 
-import csv
 import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any
 from pathlib import Path
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
+import pandas as pd
 
+from .audit_vec import SECTORS, compute_emissions
 from .models import Factory
 
 def load_config(config_path: str) -> Dict[str, Any]:
@@ -13,63 +18,110 @@ def load_config(config_path: str) -> Dict[str, Any]:
     with open(config_path) as f:
         return json.load(f)
 
-def run_audit(input_csv: str, config_path: str) -> tuple[Dict[str, Factory], List[Dict[str, Any]]]:
+# Repeated labels are read straight into categoricals in the single CSV pass
+AUDIT_CSV_DTYPES = {
+    "factory_id": "category",
+    "sector": "category",
+    "energy_source_type": "category",
+    "month": "int8",
+}
+
+def run_audit(input_csv: str,
+              config_path: str,
+              workers: int | None = None) -> tuple[Dict[str, Factory], List[Dict[str, Any]]]:
     """Process all monthly data through factories."""
+    df = pd.read_csv(input_csv, dtype=AUDIT_CSV_DTYPES)
+    return run_audit_from_df(df, config_path, workers)
+
+def run_audit_from_df(df: pd.DataFrame,
+                      config_path: str,
+                      workers: int | None = None) -> tuple[Dict[str, Factory], List[Dict[str, Any]]]:
+    """Audit monthly data that is already loaded as a DataFrame.
+
+    Monthly emissions, running totals and cap checks are computed
+    column-wise; each factory then receives its finished history in a
+    single call. With ``workers`` > 1 the emission columns are computed
+    in a process pool, one shard of whole factories per worker.
+    """
     config = load_config(config_path)
-    factories: Dict[str, Factory] = {}
-    all_records: List[Dict[str, Any]] = []
+    factory_codes, factory_ids = pd.factorize(df["factory_id"], use_na_sentinel=False)
     
-    with open(input_csv, newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            fid = row["factory_id"]
-            month = int(row["month"])
-            
-            if fid not in factories:
-                sector = row["sector"]
-                cap = config["caps_by_sector"].get(sector, 1_000_000.0)
-                factories[fid] = Factory(fid, sector, cap)
-            
-            factory = factories[fid]
-            result = factory.record_month(
-                month,
-                float(row["monthly_production_tons"]),
-                float(row["energy_used_mwh"]),
-                row.get("energy_source_type"),
-                float(row.get("raw_material_weight_tons", 0)),
-            )
-            all_records.append(result)
+    if workers is not None and workers > 1 and len(factory_ids) > 1:
+        shard_of_row = factory_codes % workers
+        shards = [np.flatnonzero(shard_of_row == k) for k in range(workers)]
+        shards = [rows for rows in shards if len(rows)]
+        with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+            parts = pool.map(compute_emissions, [df.iloc[rows] for rows in shards])
+            sector_codes = np.empty(len(df), dtype=np.int8)
+            monthly = np.empty(len(df))
+            total = np.empty(len(df))
+            for rows, (part_sectors, part_monthly, part_total) in zip(shards, parts):
+                sector_codes[rows] = part_sectors
+                monthly[rows] = part_monthly
+                total[rows] = part_total
+    else:
+        sector_codes, monthly, total = compute_emissions(df)
     
-    return factories, all_records
-
-def write_summary_csv(factories: Dict[str, Factory], output_path: str) -> None:
-    """Write year-to-date totals per factory."""
-    fieldnames = [
-        "factory_id", "sector", "total_emissions_kg",
-        "max_monthly_emissions_kg", "alerts_count"
-    ]
+    caps = np.array([config["caps_by_sector"].get(s, 1_000_000.0) for s in SECTORS])
+    factory_sector_codes = sector_codes[np.unique(factory_codes, return_index=True)[1]]
+    cap = caps[sector_codes]
+    over_cap = total > cap
     
-    with open(output_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for factory in factories.values():
-            if factory.history:
-                total = factory.total_emissions
-                max_monthly = max(r["monthly_emissions_kg"] for r in factory.history)
-                alerts = factory.alerts_count
-            else:
-                total = max_monthly = alerts = 0
-            
-            writer.writerow({
-                "factory_id": factory.factory_id,
-                "sector": factory.sector,
-                "total_emissions_kg": f"{total:.2f}",
-                "max_monthly_emissions_kg": f"{max_monthly:.2f}",
-                "alerts_count": alerts,
-            })
+    months = df["month"].to_numpy(dtype=int)
+    records_df = pd.DataFrame({
+        "monthly_emissions_kg": monthly,
+        "total_emissions_kg": total,
+        "status": np.where(over_cap, "ALERT", "OK"),
+        "cap_exceeded_by": np.where(over_cap, total - cap, 0.0),
+        "factory_id": df["factory_id"].to_numpy(),
+        "sector": np.array(SECTORS, dtype=object)[sector_codes],
+        "month": months,
+    })
+    all_records: List[Dict[str, Any]] = records_df.to_dict(orient="records")
     
+    factories: Dict[str, Factory] = {}
+    rows_by_factory = np.split(
+        np.argsort(factory_codes, kind="stable"),
+        np.cumsum(np.bincount(factory_codes))[:-1],
+    )
+    for fid, code, rows in zip(factory_ids, factory_sector_codes, rows_by_factory):
+        factory = Factory(fid, SECTORS[code], caps[code])
+        factory.load_history(months[rows], monthly[rows], total[rows])
+        factories[fid] = factory
+    
+    return factories, all_records
+
+def write_summary_csv(factories: Dict[str, Factory], output_path: str) -> pd.DataFrame:
+    """Write year-to-date totals per factory.
+
+    The same table is returned as a DataFrame so callers (e.g. the web
+    preview) don't have to read the CSV back.
+    """
+    summary = pd.DataFrame({
+        "factory_id": [f.factory_id for f in factories.values()],
+        "sector": [f.sector for f in factories.values()],
+        "total_emissions_kg": [f.total_emissions for f in factories.values()],
+        "max_monthly_emissions_kg": [f.max_monthly_emissions for f in factories.values()],
+        "alerts_count": [f.alerts_count for f in factories.values()],
+    })
+    summary.to_csv(output_path, index=False, float_format="%.2f")
+
     print(f"✅ Summary written: {output_path}")
+    return summary.round(2)
+
+# One reusable chart Figure per thread (e.g. per Flask worker thread)
+_CHART = threading.local()
+
+def _chart_figure(figsize: tuple[float, float]) -> Figure:
+    """Return this thread's cleared chart Figure, creating it on first use."""
+    fig = getattr(_CHART, "fig", None)
+    if fig is None:
+        fig = _CHART.fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+    else:
+        fig.clf()
+        fig.set_size_inches(figsize)
+    return fig
 
 def plot_emissions(
     factories: Dict[str, Factory],
@@ -82,7 +134,8 @@ def plot_emissions(
     override with a different ``figsize`` if needed (e.g. larger for
     command‑line reports).
     """
-    plt.figure(figsize=figsize)
+    fig = _chart_figure(figsize)
+    ax = fig.subplots()
     
     # Sort factories by total emissions, take top 12
     sorted_factories = sorted(
@@ -92,23 +145,21 @@ def plot_emissions(
     )[:12]
     
     for fid, factory in sorted_factories:
-        monthly = sorted(factory.history, key=lambda r: r["month"])
-        months = [r["month"] for r in monthly]
-        cumulative = [r["total_emissions_kg"] / 1000 for r in monthly]  # to metric tons
+        order = factory.month_order
+        months = factory.months[order]
+        cumulative = factory.cumulative_emissions[order] / 1000  # to metric tons
         
-        plt.plot(
+        ax.plot(
             months, cumulative, 
             marker='o', linewidth=2, markersize=4,
             label=f"{fid} ({factory.sector})",
         )
     
-    plt.xlabel("Month (2026)", fontsize=12)
-    plt.ylabel("Cumulative Emissions (metric tons CO₂)", fontsize=12)
-    plt.title("Carbon-Trace: Cumulative Emissions by Factory", fontsize=14, fontweight='bold')
-    plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    ax.set_xlabel("Month (2026)", fontsize=12)
+    ax.set_ylabel("Cumulative Emissions (metric tons CO₂)", fontsize=12)
+    ax.set_title("Carbon-Trace: Cumulative Emissions by Factory", fontsize=14, fontweight='bold')
+    ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+    ax.grid(True, alpha=0.3)
+    fig.savefig(output_path, dpi=150, bbox_inches='tight')
     
     print(f"✅ Chart saved: {output_path}")
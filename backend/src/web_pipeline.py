@@ -12,8 +12,9 @@ This module:
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 import random
-import shutil
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -23,7 +24,8 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # bring audit functionality into the web pipeline
-from .runner import run_audit, write_summary_csv, plot_emissions
+from .audit_vec import category_codes
+from .runner import run_audit_from_df, write_summary_csv, plot_emissions
 import matplotlib
 matplotlib.use("Agg")  # non-GUI backend
 
@@ -32,6 +34,12 @@ import matplotlib.pyplot as plt
 COUNTRIES = ["India", "China", "Germany", "United States", "Japan"]
 SECTORS = ["Steel", "Textile", "Electronics"]
 
+# The only OWID columns the pipeline reads
+OWID_COLUMNS = ["country", "year", "co2_per_unit_energy"]
+
+# pyarrow's multithreaded CSV reader is optional; fall back to pandas' C parser
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+
 SECTOR_MULTIPLIER: Dict[str, float] = {
     "Steel": 1.15,
     "Textile": 1.0,
@@ -39,108 +47,156 @@ SECTOR_MULTIPLIER: Dict[str, float] = {
 }
 
 
-def seasonal_factor(month: int, sector: str) -> float:
-    if sector == "Steel":
-        return 1 + 0.15 * np.sin((month - 3) / 12 * 2 * np.pi)
-    if sector == "Textile":
-        return 1 + 0.20 * np.sin((month - 10) / 12 * 2 * np.pi)
-    if sector == "Electronics":
-        return 1 + 0.18 * np.sin((month - 8) / 12 * 2 * np.pi)
-    return 1.0
+# Per-sector seasonality (amplitude, peak offset in months), indexed like SECTORS.
+SEASON_AMPLITUDE = np.array([0.15, 0.20, 0.18])
+SEASON_PHASE = np.array([3, 10, 8])
+
+# Per-sector monthly production distribution (tons), indexed like SECTORS.
+PRODUCTION_MEAN = np.array([1500.0, 600.0, 250.0])
+PRODUCTION_STD = np.array([300.0, 120.0, 60.0])
+
+# Per-sector emission multiplier as an array, indexed like SECTORS.
+SECTOR_MULTIPLIER_BY_CODE = np.array([SECTOR_MULTIPLIER[s] for s in SECTORS])
+
+MONTHS = np.arange(1, 13)
 
 
 def compute_intensity(owid_path: Path) -> pd.DataFrame:
-    """Compute country-level emission intensity (kg CO₂ / MWh) from OWID dataset."""
-    df = pd.read_csv(owid_path)
-    df = df[df["country"].isin(COUNTRIES)]
-    df = df[df["year"] >= 2018]
+    """Compute country-level emission intensity (kg CO₂ / MWh) from OWID dataset.
 
-    intensity_df = df.groupby("country")["co2_per_unit_energy"].mean().reset_index()
+    Results are memoized per file path and modification time, so repeated
+    calls on the same upload skip re-parsing the CSV.
+    """
+    owid_path = Path(owid_path)
+    return _cached_intensity(
+        str(owid_path.resolve()), owid_path.stat().st_mtime_ns
+    ).copy()
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_intensity(owid_path: str, mtime_ns: int) -> pd.DataFrame:
+    df = pd.read_csv(
+        owid_path,
+        engine=CSV_ENGINE,
+        usecols=OWID_COLUMNS,
+        dtype={"country": "category", "year": "int16", "co2_per_unit_energy": "float32"},
+    )
+    df = df[df["country"].isin(COUNTRIES) & (df["year"] >= 2018)]
+
+    intensity_df = (
+        df.groupby("country", observed=True)["co2_per_unit_energy"].mean().reset_index()
+    )
+    intensity_df["country"] = intensity_df["country"].astype(str)
     intensity_df["co2_per_mwh"] = intensity_df["co2_per_unit_energy"] * 1000
     return intensity_df
 
 
-def generate_factories(n_factories: int = 50) -> pd.DataFrame:
+def generate_factories(
+    n_factories: int = 50, countries: Optional[List[str]] = None
+) -> pd.DataFrame:
+    countries = countries or COUNTRIES
     data: List[List[str]] = []
 
     for i in range(n_factories):
         factory_id = f"FAC_{str(i + 1).zfill(3)}"
         sector = random.choice(SECTORS)
-        country = random.choice(COUNTRIES)
+        country = random.choice(countries)
         data.append([factory_id, sector, country])
 
     return pd.DataFrame(data, columns=["factory_id", "sector", "country"])
 
 
+def _monthly_kernel(
+    sector_codes: np.ndarray,
+    emission_factor: np.ndarray,
+    rand_n: np.ndarray,
+    rand_u: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Production, energy and emissions for every factory × month cell.
+
+    ``sector_codes`` and ``emission_factor`` (intensity × sector multiplier)
+    hold one value per factory; ``rand_n``/``rand_u`` are pre-drawn standard
+    normal / unit uniform samples of shape ``(n_factories, 12)``. Results
+    are built in place to avoid temporary arrays.
+    """
+    codes = sector_codes[:, None]
+
+    production = rand_n * PRODUCTION_STD[codes]
+    production += PRODUCTION_MEAN[codes]
+    production *= 1 + SEASON_AMPLITUDE[codes] * np.sin(
+        (MONTHS - SEASON_PHASE[codes]) / 12 * 2 * np.pi
+    )
+    np.maximum(production, 10, out=production)
+
+    # energy = production × U(2.5, 4.5)
+    energy_used = rand_u * 2.0
+    energy_used += 2.5
+    energy_used *= production
+
+    emission = energy_used * emission_factor[:, None]
+    return production, energy_used, emission
+
+
 def generate_monthly_factory_data(
     intensity_df: pd.DataFrame, n_factories: int = 50
 ) -> pd.DataFrame:
-    """Generate monthly factory-level data anchored to OWID intensity."""
-    factory_df = generate_factories(n_factories)
-
-    rows: List[List[Any]] = []
-
-    for _, row in factory_df.iterrows():
-        base_intensity = intensity_df[
-            intensity_df["country"] == row["country"]
-        ]["co2_per_mwh"].values[0]
-
-        for month in range(1, 13):
-            season_adj = seasonal_factor(month, row["sector"])
-
-            if row["sector"] == "Steel":
-                production = np.random.normal(1500, 300)
-            elif row["sector"] == "Textile":
-                production = np.random.normal(600, 120)
-            else:
-                production = np.random.normal(250, 60)
-
-            production = max(production * season_adj, 10)
-
-            energy_used = production * np.random.uniform(2.5, 4.5)
-
-            emission = energy_used * base_intensity
-            emission *= SECTOR_MULTIPLIER[row["sector"]]
-
-            rows.append(
-                [
-                    row["factory_id"],
-                    row["sector"],
-                    row["country"],
-                    month,
-                    production,
-                    energy_used,
-                    emission,
-                ]
-            )
-
-    columns = [
-        "factory_id",
-        "sector",
-        "country",
-        "month",
-        "production_tons",
-        "energy_used_mwh",
-        "co2_emissions_kg",
+    """Generate monthly factory-level data anchored to OWID intensity.
+
+    Every factory × month cell is drawn at once as an ``(n_factories, 12)``
+    array; flattening row-major keeps rows grouped by factory in month order.
+    Factories are only placed in countries with a known intensity.
+    """
+    country_intensity = intensity_df.set_index("country")["co2_per_mwh"].dropna()
+    factory_df = generate_factories(n_factories, list(country_intensity.index))
+
+    n_months = len(MONTHS)
+    shape = (len(factory_df), n_months)
+    sector_codes = category_codes(factory_df["sector"], SECTORS)
+    intensity = country_intensity.to_numpy(dtype=float)[
+        category_codes(factory_df["country"], country_intensity.index)
     ]
+    multiplier = SECTOR_MULTIPLIER_BY_CODE[sector_codes]
 
-    return pd.DataFrame(rows, columns=columns)
+    production, energy_used, emission = _monthly_kernel(
+        sector_codes,
+        intensity * multiplier,
+        np.random.standard_normal(shape),
+        np.random.random_sample(shape),
+    )
+
+    repeated = np.repeat(factory_df.to_numpy(), n_months, axis=0)
+
+    return pd.DataFrame(
+        {
+            "factory_id": repeated[:, 0],
+            "sector": repeated[:, 1],
+            "country": repeated[:, 2],
+            "month": np.tile(MONTHS, len(factory_df)),
+            "production_tons": production.ravel(),
+            "energy_used_mwh": energy_used.ravel(),
+            "co2_emissions_kg": emission.ravel(),
+        }
+    )
 
 
 def inject_dirty_data(df: pd.DataFrame) -> pd.DataFrame:
     """Inject missing values, duplicates, and outliers."""
-    dirty = df.copy()
+    rng = np.random.default_rng(42)
+    n = len(df)
 
     # Missing values
-    dirty.loc[dirty.sample(frac=0.05, random_state=42).index, "energy_used_mwh"] = np.nan
+    energy = df["energy_used_mwh"].to_numpy(dtype=float, copy=True)
+    energy[rng.choice(n, size=round(0.05 * n), replace=False)] = np.nan
 
-    # Duplicates
-    dirty = pd.concat([dirty, dirty.sample(15, random_state=43)], ignore_index=True)
+    # Duplicates (copied after the missing values, as they would be upstream)
+    rows = np.concatenate([np.arange(n), rng.choice(n, size=15, replace=False)])
+    dirty = df.iloc[rows].reset_index(drop=True)
+    energy = energy[rows]
 
     # Outliers
-    outlier_idx = dirty.sample(5, random_state=44).index
-    dirty.loc[outlier_idx, "energy_used_mwh"] *= 3
+    energy[rng.choice(len(rows), size=5, replace=False)] *= 3
 
+    dirty["energy_used_mwh"] = energy
     return dirty
 
 
@@ -148,35 +204,43 @@ def clean_data(df: pd.DataFrame, intensity_df: pd.DataFrame) -> pd.DataFrame:
     """Clean dataset and recompute emissions."""
     cleaned = df.drop_duplicates().copy()
 
-    cleaned["energy_used_mwh"] = cleaned.groupby("sector")["energy_used_mwh"].transform(
-        lambda x: x.fillna(x.mean())
-    )
+    sector_means = cleaned.groupby("sector")["energy_used_mwh"].transform("mean")
+    cleaned["energy_used_mwh"] = cleaned["energy_used_mwh"].fillna(sector_means)
 
     country_intensity = intensity_df.set_index("country")["co2_per_mwh"]
-    sector_mult_series = pd.Series(SECTOR_MULTIPLIER)
+    # code -1 (unknown country or sector) lands on a trailing NaN sentinel
+    intensity_by_code = np.append(country_intensity.to_numpy(dtype=float), np.nan)
+    multiplier_by_code = np.append(SECTOR_MULTIPLIER_BY_CODE, np.nan)
+
+    # work on plain arrays so each derived column costs one pass and no
+    # index alignment
+    energy = cleaned["energy_used_mwh"].to_numpy(dtype=float)
+    base_intensity = intensity_by_code[
+        category_codes(cleaned["country"], country_intensity.index)
+    ]
 
-    cleaned["co2_emissions_kg"] = (
-        cleaned["energy_used_mwh"]
-        * cleaned["country"].map(country_intensity)
-        * cleaned["sector"].map(sector_mult_series)
-    )
+    co2 = energy * base_intensity
+    co2 *= multiplier_by_code[category_codes(cleaned["sector"], SECTORS)]
+    emission_per_mwh = co2 / energy
 
-    cleaned["emission_per_mwh"] = (
-        cleaned["co2_emissions_kg"] / cleaned["energy_used_mwh"]
-    )
-    cleaned["energy_per_ton"] = (
-        cleaned["energy_used_mwh"] / cleaned["production_tons"]
-    )
+    cleaned["co2_emissions_kg"] = co2
+    cleaned["emission_per_mwh"] = emission_per_mwh
+    cleaned["energy_per_ton"] = energy / cleaned["production_tons"].to_numpy(dtype=float)
 
     # track deviation from base country intensity (used later for reporting)
-    country_intensity = intensity_df.set_index("country")["co2_per_mwh"]
-    cleaned["intensity_diff"] = (
-        cleaned["emission_per_mwh"] - cleaned["country"].map(country_intensity)
-    )
+    cleaned["intensity_diff"] = emission_per_mwh - base_intensity
 
-    assert (cleaned["production_tons"] > 0).all()
-    assert (cleaned["energy_used_mwh"] > 0).all()
-    assert (cleaned["co2_emissions_kg"] > 0).all()
+    valid = (
+        (cleaned["production_tons"].to_numpy(dtype=float) > 0)
+        & (energy > 0)
+        & (co2 > 0)
+    )
+    if not valid.all():
+        bad_rows = cleaned.index[~valid]
+        raise ValueError(
+            f"{len(bad_rows)} row(s) have non-positive or missing production, "
+            f"energy or emissions after cleaning (rows: {list(bad_rows[:10])})"
+        )
 
     return cleaned
 
@@ -222,7 +286,7 @@ def run_web_pipeline(
 
     if production_csv is not None and Path(production_csv).exists():
         # user-supplied data takes precedence
-        raw_factory_df = pd.read_csv(production_csv)
+        raw_factory_df = pd.read_csv(production_csv, engine=CSV_ENGINE)
     else:
         raw_factory_df = generate_monthly_factory_data(intensity_df)
 
@@ -237,29 +301,23 @@ def run_web_pipeline(
         columns={"production_tons": "monthly_production_tons"}
     )
 
-    cleaned_path = output_dir / "cleaned_factory_emissions_2026.csv"
-    cleaned_for_audit.to_csv(cleaned_path, index=False)
-
     # ----- run the closure audit using the cleaned dataset -----
     project_root = Path(__file__).resolve().parents[1]
-    factories, _ = run_audit(
-        input_csv=str(cleaned_path),
+    factories, _ = run_audit_from_df(
+        cleaned_for_audit,
         config_path=str(project_root / "config" / "sectors.json"),
     )
 
+    cleaned_path = output_dir / "cleaned_factory_emissions_2026.csv"
+    cleaned_for_audit.to_csv(cleaned_path, index=False)
+
     # write the same outputs as command-line runner
     audit_summary_path = output_dir / "audit_summary_2026.csv"
-    write_summary_csv(factories, str(audit_summary_path))
+    summary_df = write_summary_csv(factories, str(audit_summary_path))
 
     emissions_chart_path = output_dir / "emissions_chart.png"
     plot_emissions(factories, str(emissions_chart_path))
 
-    # copy files into static assets so templates can display them easily
-    static_root = project_root / "web" / "static" / "outputs" / output_dir.name
-    if static_root.exists():
-        shutil.rmtree(static_root)
-    shutil.copytree(output_dir, static_root)
-
     # gather aggregate + alert/violator info (mirrors CLI output)
     total_factories = len(factories)
     total_emissions_all = sum(f.total_emissions for f in factories.values())
@@ -285,7 +343,8 @@ def run_web_pipeline(
             "total_alerts": int(total_alerts),
         },
         "audit_summary_csv": str(audit_summary_path),
-        "emissions_chart": str(Path("outputs") / output_dir.name / emissions_chart_path.name),
+        "audit_preview": summary_df.head(10).to_dict(orient="records"),
+        "emissions_chart": str(emissions_chart_path),
         "violators": violators,
     }
 
@@ -1,21 +1,23 @@
 """Test closure state persistence and independence."""
 
-from src.closures import make_emission_auditor
+from src.closures import make_emission_auditor, format_alert
 from src.models import Factory
-from src.web_pipeline import run_web_pipeline
+from src.runner import run_audit
+from src.web_pipeline import run_web_pipeline, clean_data
 from pathlib import Path
 import pandas as pd
+import pytest
 
 def test_closure_accumulation():
     """Factory A accumulates correctly over months."""
     auditor = make_emission_auditor("Steel", 100000)
+    expected_monthly = 1000*2.5 + 4000*0.6  # 2500 + 2400 = 4900
     
     # 3 months of identical data
     for month in range(1, 4):
         result = auditor(1000, 4000)
-        expected_monthly = 1000*2.5 + 4000*0.6  # 2500 + 2400 = 4900
     
-    assert abs(result["monthly_emissions_kg"] - 4900) < 1, "Monthly calc wrong"
+    assert abs(result["monthly_emissions_kg"] - expected_monthly) < 1, "Monthly calc wrong"
     # after three identical months the total should be roughly three times
     assert abs(result["total_emissions_kg"] - 14700) < 1, "Should accumulate 3×4900"
     print("✅ Accumulation: PASS")
@@ -44,10 +46,136 @@ def test_alert_trigger():
     result = auditor(1500, 4000)  # ~2880 → total >5000?
     
     assert result["status"] == "ALERT"
-    assert "cap" in result["alert"].lower()
+    assert abs(result["cap_exceeded_by"] - (result["total_emissions_kg"] - 5000)) < 1e-9
+    assert "cap" in format_alert(result["total_emissions_kg"], 5000).lower()
     print("✅ Alert trigger: PASS")
 
 
+def test_batch_audit_matches_closure(tmp_path):
+    """Vectorized run_audit agrees with month-by-month closure calls."""
+    csv_path = tmp_path / "monthly.csv"
+    csv_path.write_text(
+        "factory_id,sector,month,monthly_production_tons,energy_used_mwh,energy_source_type\n"
+        "A,Textile,1,2000,5000,coal\n"
+        "B,Steel,1,1000,4000,grid\n"
+        "A,Textile,2,1500,4000,renewable\n"
+        "B,Steel,2,1200,4500,\n"
+        "C,Electronics,1,100,1000,grid\n"
+    )
+    config = Path(__file__).resolve().parents[1] / "config" / "sectors.json"
+    factories, records = run_audit(str(csv_path), str(config))
+
+    expected_a = Factory("A", "Textile", 5000)
+    expected_a.record_month(1, 2000, 5000, "coal")
+    expected_a.record_month(2, 1500, 4000, "renewable")
+
+    assert list(factories) == ["A", "B", "C"]
+    assert len(records) == 5
+    assert factories["C"].sector == "Electronics"
+    assert abs(factories["C"].total_emissions - 680) < 0.01
+    assert abs(factories["A"].total_emissions - expected_a.total_emissions) < 0.01
+    assert abs(factories["B"].total_emissions - (4900 + 5700)) < 0.01
+    assert factories["B"].alerts_count == 0
+    print("✅ Batch audit: PASS")
+
+
+def test_sharded_audit_matches_serial(tmp_path):
+    """workers > 1 gives the same results as the single-process audit."""
+    csv_path = tmp_path / "monthly.csv"
+    lines = ["factory_id,sector,month,monthly_production_tons,energy_used_mwh,energy_source_type"]
+    for month in range(1, 4):
+        # factories interleaved row by row, as in a month-major file
+        lines += [
+            f"A,Steel,{month},{1000 + month},4000,coal",
+            f"B,Textile,{month},{2000 + month},5000,grid",
+            f"C,Electronics,{month},{300 + month},1000,renewable",
+        ]
+    csv_path.write_text("\n".join(lines) + "\n")
+    config = Path(__file__).resolve().parents[1] / "config" / "sectors.json"
+
+    serial_factories, serial_records = run_audit(str(csv_path), str(config))
+    sharded_factories, sharded_records = run_audit(str(csv_path), str(config), workers=2)
+
+    assert list(sharded_factories) == list(serial_factories)
+    assert sharded_records == serial_records
+    for fid, factory in serial_factories.items():
+        assert sharded_factories[fid].history == factory.history
+    print("✅ Sharded audit: PASS")
+
+
+def test_batch_audit_keeps_blank_factory_id(tmp_path):
+    """Rows without a factory_id are audited as one factory, not dropped."""
+    csv_path = tmp_path / "monthly.csv"
+    csv_path.write_text(
+        "factory_id,sector,month,monthly_production_tons,energy_used_mwh\n"
+        "A,Steel,1,1000,4000\n"
+        ",Steel,1,1000,4000\n"
+        ",Steel,2,1000,4000\n"
+    )
+    config = Path(__file__).resolve().parents[1] / "config" / "sectors.json"
+    factories, records = run_audit(str(csv_path), str(config))
+
+    assert len(factories) == 2
+    assert len(records) == 3
+    blank = next(f for fid, f in factories.items() if fid != "A")
+    assert abs(blank.total_emissions - 2 * 4900) < 0.01
+    print("✅ Blank factory_id: PASS")
+
+
+def test_batch_audit_and_closure_share_multipliers(tmp_path):
+    """A factory's history uses one energy multiplier table throughout."""
+    csv_path = tmp_path / "monthly.csv"
+    csv_path.write_text(
+        "factory_id,sector,month,monthly_production_tons,energy_used_mwh,energy_source_type\n"
+        "A,Steel,1,1000,4000,coal\n"
+    )
+    config = tmp_path / "sectors.json"
+    config.write_text(
+        '{"caps_by_sector": {"Steel": 100000}, "energy_multipliers": {"coal": 1.5}}'
+    )
+    factories, _ = run_audit(str(csv_path), str(config))
+    result = factories["A"].record_month(2, 1000, 4000, "coal")
+
+    assert factories["A"].monthly_emissions[0] == pytest.approx(4900 * 1.2)
+    assert result["monthly_emissions_kg"] == pytest.approx(4900 * 1.2)
+    print("✅ Shared multipliers: PASS")
+
+
+def test_clean_data_rejects_invalid_rows():
+    """Rows left non-positive after cleaning are reported, not asserted."""
+    intensity = pd.DataFrame({"country": ["India"], "co2_per_mwh": [700.0]})
+    df = pd.DataFrame({
+        "factory_id": ["F1", "F2"],
+        "sector": ["Steel", "Steel"],
+        "country": ["India", "India"],
+        "month": [1, 1],
+        "production_tons": [100.0, -5.0],
+        "energy_used_mwh": [300.0, 300.0],
+    })
+
+    with pytest.raises(ValueError, match="1 row"):
+        clean_data(df, intensity)
+    print("✅ Invalid rows rejected: PASS")
+
+
+def test_clean_data_categorical_sector():
+    """Sector multipliers follow the labels, not the categorical codes."""
+    intensity = pd.DataFrame({"country": ["India"], "co2_per_mwh": [1000.0]})
+    df = pd.DataFrame({
+        "factory_id": ["F1", "F2", "F3"],
+        "sector": ["Textile", "Steel", "Electronics"],
+        "country": ["India", "India", "India"],
+        "month": [1, 1, 1],
+        "production_tons": [100.0, 100.0, 100.0],
+        "energy_used_mwh": [1.0, 1.0, 1.0],
+    }).astype({"sector": "category", "country": "category"})
+
+    cleaned = clean_data(df, intensity)
+
+    assert cleaned["co2_emissions_kg"].tolist() == pytest.approx([1000, 1150, 850])
+    print("✅ Categorical sector cleaning: PASS")
+
+
 # additional sanity check for the web pipeline
 
 def test_web_pipeline(tmp_path):
@@ -81,8 +209,16 @@ if __name__ == "__main__":
     test_closure_accumulation()
     test_factory_independence()
     test_alert_trigger()
-    # run quick pipeline check using a temporary directory
+    test_clean_data_rejects_invalid_rows()
+    test_clean_data_categorical_sector()
+    # tests that write files each get their own temporary directory
     import tempfile, pathlib
-    tmpdir = pathlib.Path(tempfile.mkdtemp())
-    test_web_pipeline(tmpdir)
+    for test in (
+        test_batch_audit_matches_closure,
+        test_sharded_audit_matches_serial,
+        test_batch_audit_keeps_blank_factory_id,
+        test_batch_audit_and_closure_share_multipliers,
+        test_web_pipeline,
+    ):
+        test(pathlib.Path(tempfile.mkdtemp()))
     print("🎉 All tests PASSED!")
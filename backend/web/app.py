@@ -79,17 +79,7 @@ def create_app() -> Flask:
 
         cleaned_csv_rel = os.path.relpath(result["cleaned_csv"], project_root)
         audit_summary_rel = os.path.relpath(result["audit_summary_csv"], project_root)
-        chart_rel = result["emissions_chart"]
-
-        # read first few rows of the audit summary for inline display
-        try:
-            import pandas as pd
-
-            audit_preview = pd.read_csv(result["audit_summary_csv"]).head(10).to_dict(
-                orient="records"
-            )
-        except Exception:  # pragma: no cover - optional feature
-            audit_preview = []
+        chart_name = Path(result["emissions_chart"]).name
 
         return render_template(
             "result.html",
@@ -97,11 +87,16 @@ def create_app() -> Flask:
             cleaned_csv_path=cleaned_csv_rel,
             summary=result["summary"],
             audit_summary_path=audit_summary_rel,
-            audit_preview=audit_preview,
-            emissions_chart=chart_rel,
+            audit_preview=result.get("audit_preview", []),
+            emissions_chart=chart_name,
             violators=result.get("violators", []),
         )
 
+    @app.route("/outputs/<session_id>/<path:filename>", methods=["GET"])
+    def outputs(session_id: str, filename: str):
+        # served straight from the pipeline's output directory
+        return send_from_directory(outputs_dir, f"{session_id}/{filename}")
+
     @app.route("/download/<path:filename>", methods=["GET"])
     def download(filename: str):
         project_root_str = str(project_root)